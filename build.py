@@ -17,7 +17,9 @@ GUI for generating or testing code to create a slider object.
 
 """
 
-import importlib
+import contextlib
+import functools
+import re
 import tkinter as tk
 import tkinter.ttk as ttk
 import tkinter.scrolledtext
@@ -25,6 +27,22 @@ from tkinter import messagebox
 import slider
 import config
 
+# Slider options that can be changed on an existing slider, initial_value
+# by setting the slider
+LIVE_OPTIONS = {"relief", "initial_value"}
+# Conversion of form field input to its kwarg_type
+CONVERTERS = {"int": int, "float": float, "str": str, "bool": bool}
+# Milliseconds of quiet in the form before the preview is redrawn
+REDRAW_DELAY = 80
+# A "kwarg_name=kwarg_value" line in the code pane. The value is captured
+# without its trailing comma.
+KWARG_RE = re.compile(
+    r"^[ \t]*(?P<name>[A-Za-z_]\w*)[ \t]*=[ \t]*(?P<value>.*?)[ \t]*,?[ \t]*$",
+    re.MULTILINE,
+)
+# Characters removed from values found in the code pane
+STRIP_TABLE = str.maketrans("", "", "'\"()")
+
 
 class Formfield:
     """ Class to bundle a label, an input widget, a tk variable and a
@@ -32,6 +50,26 @@ class Formfield:
     form, and the efficient gathering from this form of a set of
     keyword arguments to create a slider.
     """
+    __slots__ = (
+        "parent",
+        "kwarg_name",
+        "kwarg_type",
+        "kwarg_label_text",
+        "default_val",
+        "tool_tip_txt",
+        "widget_type",
+        "widget_readonly",
+        "values",
+        "label",
+        "tk_var",
+        "widget",
+        "tool_tip",
+        "converter",
+        "on_change",
+        "_dirty",
+        "_cached_value",
+    )
+
     def __init__(
             self,
             parent,
@@ -43,6 +81,7 @@ class Formfield:
             widget_type=None,
             widget_readonly=False,
             values=None,
+            on_change=None,
     ):
         self.parent = parent
         self.kwarg_name = kwarg_name
@@ -53,6 +92,7 @@ class Formfield:
         self.widget_type = widget_type
         self.widget_readonly = widget_readonly
         self.values = values
+        self.on_change = on_change
 
         # Create label
         self.label = tk.Label(self.parent, text=self.kwarg_label_text)
@@ -89,6 +129,7 @@ class Formfield:
                     "Formfield received an unknown widget_type.")
         else:
             raise TypeError("Formfield received an unknown kwarg_type.")
+        self.converter = CONVERTERS[self.kwarg_type]
 
         # Create tooltip
         if self.tool_tip_txt:
@@ -100,22 +141,35 @@ class Formfield:
         else:
             self.tool_tip = None
 
+        # Converted input is cached until tk_var is written to
+        self._dirty = True
+        self._cached_value = None
+        self.tk_var.trace_add("write", self._invalidate)
+
     def get(self):
         """ Return the type-checked value of the formfield input
         widget
         """
         # Exception will be raised when widget contains invalid value,
         # these must be handled by caller
-        retval = self.tk_var.get()
-        # Convert to specified type only if value is not default,
-        # effectively allowing default values like "<auto>" for numeric
-        # fields.
-        if retval != self.default_val:
-            if self.kwarg_type == "int":
-                retval = int(retval)
-            elif self.kwarg_type == "float":
-                retval = float(retval)
-        return retval
+        if self._dirty:
+            retval = self.tk_var.get()
+            # Convert to specified type only if value is not default,
+            # effectively allowing default values like "<auto>" for
+            # numeric fields.
+            if retval != self.default_val:
+                retval = self.converter(retval)
+            self._cached_value = retval
+            self._dirty = False
+        return self._cached_value
+
+    def _invalidate(self, *_):
+        """ Trace callback: input changed, drop the cached value and
+        tell whoever wants to know
+        """
+        self._dirty = True
+        if self.on_change:
+            self.on_change(self)
 
 
 class Prebuilt:
@@ -123,6 +177,8 @@ class Prebuilt:
     definitions of a prebuilt slider. Enables easy creation of the
     tab where a prebuilt can be selected.
     """
+    __slots__ = ("identifier", "args", "btn")
+
     def __init__(self,
                  parent,
                  tk_var,
@@ -139,30 +195,31 @@ class Prebuilt:
         )
 
 
-class Tooltip(tk.Button):
-    """ Simple tooltip button"""
+class Tooltip(tk.Label):
+    """ Simple tooltip, a clickable question mark. All tooltips share
+    a single class binding that shows the message of the tooltip that
+    was clicked.
+    """
     def __init__(
             self,
             parent,
             message_title,
             message,
     ):
-        self.message = message
-        self.message_title = message_title
-        self.parent = parent
         super().__init__(
-            self.parent,
+            parent,
             text="?",
             fg="#00008b",
-            takefocus=0,
-            command=self.show_msg
+            cursor="question_arrow",
         )
+        self.tooltip_data = (message_title, message)
+        tags = self.bindtags()
+        self.bindtags(tags[:2] + ("Tooltip",) + tags[2:])
 
-    def show_msg(self):
-        tk.messagebox.showinfo(
-            self.message_title,
-            self.message
-        )
+    @staticmethod
+    def show_msg(event):
+        """ Handler for the Tooltip class binding """
+        tk.messagebox.showinfo(*event.widget.tooltip_data)
 
 
 class Creator():
@@ -172,9 +229,27 @@ class Creator():
         self.parent = parent
         self.parent.title("Create slider")
         self.parent.geometry("+50+50")
-        self.form_fields = []
-        self.field_index = {}
+        self.fields = {}  # Formfields by kwarg_name
+        self.form_kwargs = {}  # Non-default form values by kwarg_name
+        self.changed_fields = set()  # Formfields changed since last redraw
+        self.kwargs = {}
+        # Per field lists in self.fields order, for resetting the form
+        self._tk_vars = []
+        self._defaults = []
+        self.field_tabs = {}
+        self.valid_kwargs = frozenset(config.fields_by_name)
+        self.tab_builders = {}
+        self.observing = False
+        self.code_pane = None
+        self.code_string = ""
+        self.code_shown = True  # code pane holds exactly code_string
         self.args = {}
+        self._pending_redraw = None
+        self._dirty = False
+        self._last_kwargs = None
+        self._last_req_size = None
+        self.error_label = None  # created on first error, then reused
+        self.shown_widget = None  # slider or error label in preview pane
 
         # Gentle quit
         self.parent.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -193,8 +268,9 @@ class Creator():
         # Enable auto-update of preview when user input changes
         self.enable_observatory()
 
-        # Draw initial slider
-        self.create_preview()
+        # Draw initial slider right away, so the window is complete when
+        # first shown. Only user edits wait for the redraw delay.
+        self._do_create_preview()
 
     # init
     def init_gui(self):
@@ -204,8 +280,10 @@ class Creator():
         # Create five-tab notebook
         s = ttk.Style()
         s.configure('TNotebook', tabposition=tk.NW)
+        self.parent.bind_class("Tooltip", "<Button-1>", Tooltip.show_msg)
         form_pane = ttk.Notebook(self.parent)
         form_pane.grid(row=0, column=0, sticky=tk.NSEW)
+        form_pane.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         # Tab 1: Prebuilts selection
         self.form_tab_1 = tk.Frame(form_pane)
@@ -225,6 +303,7 @@ class Creator():
         # Create three-tab notebook for slider, code preview and help
         self.preview_pane = ttk.Notebook(self.parent)
         self.preview_pane.grid(row=0, column=1, sticky=tk.NSEW)
+        self.preview_pane.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         self.preview_tab_1 = tk.Frame(self.preview_pane)
         self.preview_tab_1.rowconfigure(0, weight=1)
@@ -260,7 +339,52 @@ class Creator():
                                )
         value_label.grid(row=0, column=1, sticky=tk.W)
 
-        # Configure preview tab 2
+        # Preview tab 2 (Code) and 3 (Help) are filled when first shown
+        self.tab_builders[self.preview_tab_2] = self.build_code_pane
+        self.tab_builders[self.preview_tab_3] = self.build_help_pane
+
+        # Tabs configured, finalize main window
+        # Create main window buttons
+        tk.Button(
+            self.parent,
+            text="Reset form",
+            command=self.reset,
+        ).grid(column=0, row=1, padx=30, pady=5, sticky=tk.W)
+
+        main_button_pane = tk.Frame(self.parent)
+        main_button_pane.rowconfigure(0, weight=1)
+        main_button_pane.columnconfigure(3, weight=1)
+        main_button_pane.grid(column=1, row=1, padx=30, pady=5, sticky=tk.NSEW)
+
+        """
+        # Dev / debugging only: reimport slider, needs import importlib
+        tk.Button(
+            main_button_pane,
+            text="Reimport slider",
+            command=lambda: importlib.reload(slider)
+        ).grid(row=0, column=0, padx=0, pady=10, sticky=tk.W)
+        """
+
+        tk.Button(
+            main_button_pane,
+            text="Enable slider",
+            command=lambda: self.my_slider.enable()
+        ).grid(row=0, column=1, padx=0, pady=10, sticky=tk.W)
+
+        tk.Button(
+            main_button_pane,
+            text="Disable slider",
+            command=lambda: self.my_slider.disable()
+        ).grid(row=0, column=2, padx=0, pady=10, sticky=tk.W)
+
+        tk.Button(
+            main_button_pane,
+            text="Quit",
+            command=self.on_closing
+        ).grid(row=0, column=3, padx=0, pady=10, sticky=tk.E)
+
+    def build_code_pane(self):
+        """ Fill preview tab 2 with the code pane and its buttons """
         # Create a preview pane for the code
         self.code_pane = tk.scrolledtext.ScrolledText(
             self.preview_tab_2,
@@ -272,30 +396,17 @@ class Creator():
             highlightthickness=0,
             font=("Courier", "16")
         )
+        self.code_pane.insert(1.0, self.code_string)
+        self.code_pane.edit_modified(False)
         self.code_pane.grid()
 
-        # Configure preview tab 3 (Help)
-        # Create a pane
-        self.help_pane = tk.scrolledtext.ScrolledText(
-            self.preview_tab_3,
-            takefocus=0,
-            width=70,
-            height=20,
-            padx=10,
-            pady=10,
-            highlightthickness=0,
-            font=("Courier", "16")
-        )
-        self.help_pane.insert(1.0, config.help_text)
-        self.help_pane.grid()
-
         # Create tags to change code font color
         self.code_pane.tag_configure("red", foreground="red")
         self.code_pane.tag_configure("green", foreground="green")
 
-        # Change font color when user bepotles code
-        for event in ("<Control-v>", "<KeyPress>"):
-            self.code_pane.bind(event, self.code_changed)
+        # Change font color when user bepotles code. Code inserted by
+        # the program resets the modified flag, so it is left alone.
+        self.code_pane.bind("<<Modified>>", self.code_changed)
 
         # Create buttons to copy/paste/run the code in the code pane
         code_button_pane = tk.Frame(self.preview_tab_2)
@@ -326,79 +437,40 @@ class Creator():
             command=self.run_code
         ).grid(row=0, column=2, sticky=tk.E)
 
-        # Tabs configured, finalize main window
-        # Create main window buttons
-        tk.Button(
-            self.parent,
-            text="Reset form",
-            command=self.reset,
-        ).grid(column=0, row=1, padx=30, pady=5, sticky=tk.W)
-
-        main_button_pane = tk.Frame(self.parent)
-        main_button_pane.rowconfigure(0, weight=1)
-        main_button_pane.columnconfigure(3, weight=1)
-        main_button_pane.grid(column=1, row=1, padx=30, pady=5, sticky=tk.NSEW)
-
-        """
-        # Dev / debugging only: reimport slider
-        tk.Button(
-            main_button_pane,
-            text="Reimport slider",
-            command=lambda: importlib.reload(slider)
-        ).grid(row=0, column=0, padx=0, pady=10, sticky=tk.W)
-        """
-
-        tk.Button(
-            main_button_pane,
-            text="Enable slider",
-            command=lambda: self.my_slider.enable()
-        ).grid(row=0, column=1, padx=0, pady=10, sticky=tk.W)
-
-        tk.Button(
-            main_button_pane,
-            text="Disable slider",
-            command=lambda: self.my_slider.disable()
-        ).grid(row=0, column=2, padx=0, pady=10, sticky=tk.W)
-
-        tk.Button(
-            main_button_pane,
-            text="Quit",
-            command=self.on_closing
-        ).grid(row=0, column=3, padx=0, pady=10, sticky=tk.E)
+    def build_help_pane(self):
+        """ Fill preview tab 3 with the help text """
+        self.help_pane = tk.scrolledtext.ScrolledText(
+            self.preview_tab_3,
+            takefocus=0,
+            width=70,
+            height=20,
+            padx=10,
+            pady=10,
+            highlightthickness=0,
+            font=("Courier", "16")
+        )
+        self.help_pane.insert(1.0, config.help_text)
+        self.help_pane.grid()
 
     # init
     def init_prebuilt_selector(self):
         """ Fill tab 1 with a list of selectable prebuilt sliders """
 
-        self.prebuilts = []
+        self.prebuilts = {}  # Prebuilt options by identifier
         self.current_prebuilt = tk.StringVar(value="Default")
 
         # Create the prebuilt options
-        self.prebuilts.extend(
-            Prebuilt(
+        for style_name in config.prebuilts:
+            self.prebuilts[style_name] = Prebuilt(
                 self.form_tab_1,
                 tk_var=self.current_prebuilt,
                 identifier=style_name,
             )
-            for style_name in config.prebuilts
-        )
 
-        # Create a dict to lookup index of prebuilt by identifier
-        self.prebuilt_index = {
-            prebuilt.identifier: index
-            for index, prebuilt
-            in enumerate(self.prebuilts)
-        }
-
-        # Grid the prebuilt options
-        for row, prebuilt in enumerate(self.prebuilts):
-            prebuilt.btn.grid(
-                row=row,
-                column=0,
-                padx=10,
-                pady=5,
-                sticky=tk.NW
-            )
+        # Grid the prebuilt options, only the row differs per option
+        grid_options = {"column": 0, "padx": 10, "pady": 5, "sticky": tk.NW}
+        for row, prebuilt in enumerate(self.prebuilts.values()):
+            prebuilt.btn.grid(row=row, **grid_options)
 
         # Automatically create a prebuilt slider upon selection
         self.prebuilts_trace_id = self.current_prebuilt.trace_variable(
@@ -409,62 +481,61 @@ class Creator():
     # init
     def init_config_options(self):
         """ For every keyword argument accepted by class slider, create
-        a form field in the appropriate tab.
+        a form field in the appropriate tab. Tabs are filled when first
+        shown, or when one of their form fields is needed.
         """
-        for args in config.basic_fields:
-            self.form_fields.append(
-                Formfield(self.form_tab_2, **args)
-            )
-
-        for args in config.track_thumb_fields:
-            self.form_fields.append(
-                Formfield(self.form_tab_3, **args)
-            )
-
-        for args in config.colors_fonts_fields:
-            self.form_fields.append(
-                Formfield(self.form_tab_4, **args)
-            )
-
-        for args in config.advanced_fields:
-            self.form_fields.append(
-                Formfield(self.form_tab_5, **args)
+        form_tabs = (
+            self.form_tab_2,
+            self.form_tab_3,
+            self.form_tab_4,
+            self.form_tab_5,
+        )
+        for tab, field_defs in zip(form_tabs, config.sections):
+            self.tab_builders[tab] = functools.partial(
+                self.build_form_tab,
+                tab,
+                field_defs
             )
-
-        # Create a dict to lookup index of formfield by kwarg_name
-        self.field_index = {
-            field.kwarg_name: index
-            for index, field
-            in enumerate(self.form_fields)
-        }
+            for spec in field_defs:
+                self.field_tabs[spec.kwarg_name] = tab
+
+    def build_form_tab(self, tab, field_defs):
+        """ Create, bind and grid the form fields of one tab """
+        # Create the formfields, and store them by kwarg_name
+        fields = []
+        for spec in field_defs:
+            field = Formfield(tab, *spec, on_change=self.field_changed)
+            self.fields[field.kwarg_name] = field
+            self._tk_vars.append(field.tk_var)
+            self._defaults.append(field.default_val)
+            fields.append(field)
 
         # Bind entry and combo boxes to validation and correction
         # method.
-        for field in self.form_fields:
+        for field in fields:
             if field.widget_type in ("entry", "combo"):
-                field.widget["validate"] = "focusout"
-                field.widget["validatecommand"] = (self.validator, "%P")
-                field.widget["invalidcommand"] = (
-                    self.corrector,
-                    # Can't pass widget, send index (will become str)
-                    self.field_index[field.kwarg_name]
+                field.widget.configure(
+                    validate="focusout",
+                    validatecommand=(self.validator, "%P"),
+                    # Can't pass widget, send kwarg_name
+                    invalidcommand=(self.corrector, field.kwarg_name),
                 )
 
-        # Grid the formfields
-        for row, field in enumerate(self.form_fields):
-            field.label.grid(
-                row=row,
-                column=0,
-                padx=10,
-                pady=5,
-                sticky=tk.NW
-            )
-            field.widget.grid(
-                row=row,
-                column=1,
-                padx=10,
-                pady=5,
-                sticky=tk.NW
+        # Grid the formfields and their tooltips.
+        # Grid arranges the tab once at idle time, so gridding row by row
+        # does not relayout per call.
+        for row, field in enumerate(fields):
+            # One grid command per row, label and widget take columns
+            # 0 and 1
+            tab.tk.call(
+                "grid",
+                field.label,
+                field.widget,
+                "-row", row,
+                "-column", 0,
+                "-padx", 10,
+                "-pady", 5,
+                "-sticky", tk.NW,
             )
             if field.tool_tip:
                 field.tool_tip.grid(
@@ -474,15 +545,75 @@ class Creator():
                     sticky=tk.NW
                 )
 
+        # Let the observatory watch the new fields
+        self.observe(fields)
+
+    def field_changed(self, field):
+        """ Callback for Formfield, remember field for the next redraw """
+        self.changed_fields.add(field)
+
+    def build_tab(self, tab):
+        """ Fill tab with its contents if not done yet """
+        builder = self.tab_builders.pop(tab, None)
+        if builder:
+            builder()
+
+    def realize_field(self, kwarg_name):
+        """ Make sure the form field for kwarg_name exists.
+        Raises KeyError for an unknown kwarg_name.
+        """
+        self.build_tab(self.field_tabs[kwarg_name])
+
+    def on_tab_changed(self, event):
+        """ Callback for notebooks, build a tab when first selected """
+        notebook = event.widget
+        self.build_tab(notebook.nametowidget(notebook.select()))
+
+    # Handle changes in form input
+    def _mark_dirty(self, *_):
+        """ Flag the preview as outdated and schedule a redraw. Each
+        change postpones the redraw, so a burst of changes results in a
+        single redraw.
+        """
+        if not self.observing:
+            return
+        self._dirty = True
+        if self._pending_redraw is not None:
+            self.parent.after_cancel(self._pending_redraw)
+        self._pending_redraw = self.parent.after(
+            REDRAW_DELAY,
+            self._run_pending
+        )
+
+    @contextlib.contextmanager
+    def _silent(self):
+        """ Suspend auto-redraw while (re)setting the form, redraw once
+        when done.
+        """
+        observing = self.observing
+        self.disable_observatory()
+        try:
+            yield
+        finally:
+            if observing:
+                self.enable_observatory()
+        self._do_create_preview()
+
+    def _run_pending(self):
+        """ Run the scheduled redraw, unless already done. """
+        self._pending_redraw = None
+        if self._dirty:
+            self._do_create_preview()
+
     # Main method for handling changes in form input
-    def create_preview(self, *_):
+    def _do_create_preview(self):
         """ Create a slider and code based on current form values. """
         # Get arguments from form and try to create a slider
-        self.kwargs = {}
-        self.clear_preview_pane()
-        self.code_pane.delete(1.0, tk.END)
+        self._dirty = False
 
-        for field in self.form_fields:
+        # Only fields changed since the last redraw need to be read,
+        # a field stays changed until its input is valid
+        for field in list(self.changed_fields):
             try:
                 value = field.get()
             except ValueError:
@@ -492,62 +623,134 @@ class Creator():
 
             # Omit defaults as slider sets defaults itself
             if value != field.default_val:
-                self.kwargs[field.kwarg_name] = value
+                self.form_kwargs[field.kwarg_name] = value
+            else:
+                self.form_kwargs.pop(field.kwarg_name, None)
+            self.changed_fields.discard(field)
+
+        # Arguments in form order, as shown in the code. Fields are
+        # created per tab on demand, so take the order from config.
+        self.kwargs = {
+            spec.kwarg_name: self.form_kwargs[spec.kwarg_name]
+            for spec in config.all_fields
+            if spec.kwarg_name in self.form_kwargs
+        }
+
+        # Create code
+        """
+        # Debug / dev only:
+        # Create dict-style code
+        # Useful when generating prebuilts for config.py
+        code_lines = [""]
+        code_lines.extend(
+            f"'{key}': {arg!r}," for key, arg in self.kwargs.items()
+        )
+        code_lines.append("")
+        self.code_pane.insert(1.0, "\n".join(code_lines))
+        """
 
+        # repr quotes strings, numbers and booleans show as they are
+        code_lines = ["slider.Slider(", "    root,"]
+        code_lines.extend(
+            f"    {key}={arg!r}," for key, arg in self.kwargs.items()
+        )
+        code_lines.append(")")
+        self.show_code("\n".join(code_lines))
+
+        # Nothing more to do if the slider on display matches the form.
+        # The code is shown anyway, the user may have edited it.
+        if self.kwargs == self._last_kwargs:
+            return
+        self.update_slider(self.kwargs)
+
+        # Reset window size to fit contents neatly, only when the
+        # contents ask for a different size
+        self.parent.update_idletasks()
+        req_size = (
+            self.parent.winfo_reqwidth(),
+            self.parent.winfo_reqheight()
+        )
+        if req_size != self._last_req_size:
+            self._last_req_size = req_size
+            self.parent.geometry("")
+
+    def update_slider(self, kwargs):
+        """ Bring the slider in the preview pane in line with kwargs.
+        Options an existing slider can take are applied in place, any
+        other change requires a new slider.
+        """
+        if self._last_kwargs is not None:
+            changed = {
+                name
+                for name in kwargs.keys() | self._last_kwargs.keys()
+                if kwargs.get(name) != self._last_kwargs.get(name)
+            }
+            if not changed:
+                return
+            live = changed <= LIVE_OPTIONS
+            # Without initial_value a slider starts at start_value,
+            # leave that to a new slider
+            if "initial_value" in changed and "initial_value" not in kwargs:
+                live = False
+            if live:
+                try:
+                    self.apply_live_options(changed)
+                except Exception:
+                    # Leave it to a new slider to report the error
+                    pass
+                else:
+                    self.my_slider.update_idletasks()
+                    self._last_kwargs = kwargs
+                    return
+
+        self.clear_preview_pane()
         try:
             self.my_slider = slider.Slider(
                 self.slider_pane,
-                **self.kwargs,
+                **kwargs,
             )
         except Exception as exception:
+            # Remove what got built of the failed slider
+            for widget in self.slider_pane.winfo_children():
+                if widget is not self.error_label:
+                    widget.destroy()
             msg = "Error in args, try again\n" + str(exception)
             self.show_error(msg)
             raise
+        self.my_slider.add_subscriber(self.slider_value)
 
-        # Create a slider
+        # Show the slider
         self.my_slider.grid(row=0, column=0)
-        self.my_slider.add_subscriber(self.slider_value)
+        self.shown_widget = self.my_slider
+        self._last_kwargs = kwargs
 
-        # Create code
-        """
-        # Debug / dev only:
-        # Create dict-style code
-        # Useful when generating prebuilts for config.py
-        code_string = "\n"
-        for key in self.kwargs:
-            arg = self.kwargs.get(key)
-            val = f"'{arg}'" if type(arg) is str else arg
-            code_string += f"'{key}': {val},"
-            code_string += "\n"
-        self.code_pane.insert(1.0, code_string)
+    def apply_live_options(self, names):
+        """ Apply the form values of names to the slider on display, the
+        way a new slider would take them.
         """
-
-        code_string = "slider.Slider(\n    root,"
-        for key in self.kwargs:
-            arg = self.kwargs.get(key)
-            val = f"'{arg}'" if type(arg) is str else arg
-            code_string += f"\n    {key}={val},"
-        code_string += "\n)"
-        self.code_pane.insert(1.0, code_string)
-
-        # Reset window size to fit contents neatly
-        self.parent.geometry("")
+        for name in names:
+            value = self.fields[name].get()
+            if name == "initial_value":
+                # A new slider starts enabled
+                if not self.my_slider.engine.active:
+                    self.my_slider.enable()
+                self.my_slider.set(value)
+            else:
+                self.my_slider.configure({name: value})
 
     # Build a prebuilt slider when selected
     def set_prebuilt(self, *_):
         """ Create a slider from preset arguments stored in the
         'prebuilt' object
         """
-        self.reset(redraw=False)
-        self.disable_observatory()
-        index = self.prebuilt_index[self.current_prebuilt.get()]
-        for key in self.prebuilts[index].args:
-            value = self.prebuilts[index].args[key]
-            field_index = self.field_index[key]
-            self.form_fields[field_index].tk_var.set(value)
-        self.preview_pane.select(self.preview_tab_1)
-        self.create_preview()
-        self.enable_observatory()
+        with self._silent():
+            self.reset(redraw=False)
+            args = self.prebuilts[self.current_prebuilt.get()].args
+            fields = self.fields
+            for key, value in args.items():
+                self.realize_field(key)
+                fields[key].tk_var.set(value)
+            self.preview_pane.select(self.preview_tab_1)
 
     # Create a slider from code input
     def run_code(self):
@@ -558,82 +761,67 @@ class Creator():
         self.clear_preview_pane()
         self.reset(redraw=False)  # preserve code until all is well
         self.disable_observatory()
-        kwargs = {}
+        values = {}
         kwargs_okay = True
         invalid_kwargs = []
 
-        code = (self.code_pane.get("1.0", tk.END)).split("\n")
-        for line in code:
-            if line.find("=") != -1:
-                # Consider portion before "=" to be kwarg_name, and the
-                # portion after to be kwarg_value
-                kwarg_name, kwarg_value = line.split("=")
-
-                # Do some cleaning
-                kwarg_name = kwarg_name.strip()
-                kwarg_value = kwarg_value.strip()
-                kwarg_value = kwarg_value.rstrip(",")
+        code = self.code_pane.get("1.0", tk.END)
+        for match in KWARG_RE.finditer(code):
+            kwarg_name = match["name"]
+            kwarg_value = match["value"].translate(STRIP_TABLE)
 
-                for character in ("'", '"', "(", ")"):
-                    kwarg_value = kwarg_value.replace(character, "")
-
-                # Test if keyword is valid
-                try:
-                    index = self.field_index[kwarg_name]
-                    kwargs[index] = kwarg_value
-                except KeyError:
-                    kwargs_okay = False
-                    invalid_kwargs.append(kwarg_name)
+            # Test if keyword is valid
+            if kwarg_name in self.valid_kwargs:
+                self.realize_field(kwarg_name)
+                values[kwarg_name] = kwarg_value
+            else:
+                kwargs_okay = False
+                invalid_kwargs.append(kwarg_name)
 
         if kwargs_okay:
-            for index in kwargs:
-                self.form_fields[index].tk_var.set(kwargs[index])
-            # Note create_preview will override contents of code pane
+            for kwarg_name, value in values.items():
+                self.fields[kwarg_name].tk_var.set(value)
+            # Note _do_create_preview will override contents of code pane
             # with newly generated code
             self.preview_pane.select(self.preview_tab_1)
-            self.create_preview()
+            self._do_create_preview()
         else:
             msg = f"\nInvalid arguments found:\n"
             self.code_pane.insert(tk.END, msg, "red")
             for arg in invalid_kwargs:
                 self.code_pane.insert(tk.END, f"\n{arg}", "red")
             self.code_pane.see(tk.END)
+            self.code_pane.edit_modified(False)
+            self.code_shown = False
         self.enable_observatory()
 
-    # Enable auto-update of preview when form input changes
-    def enable_observatory(self):
-        """ Auto-redraw preview when input values change.
-        Entry and combo will be bound to specific events in order
-        to let validation do its work and to prevent all too jumpy
-        behaviour. For other widgets we simply trace the tk_var of
-        the widget.
+    # Auto-update preview when form input changes
+    def observe(self, fields):
+        """ Bind or trace form fields to flag the preview as outdated,
+        once for every field. Entry and combo will be bound to specific
+        events in order to let validation do its work and to prevent
+        all too jumpy behaviour. For other widgets we simply trace the
+        tk_var of the widget.
         """
-        for field in self.form_fields:
+        for field in fields:
             if field.widget_type in ("entry", "combo"):
                 for event in ("<FocusOut>",
                               "<Return>",
                               "<<ComboboxSelected>>"
                               ):
-                    field.widget.bind(event, self.create_preview)
+                    field.widget.bind(event, self._mark_dirty)
             else:
-                field.trace_id = field.tk_var.trace_variable(
-                    "w",
-                    self.create_preview
-                )
+                field.tk_var.trace_add("write", self._mark_dirty)
+
+    def enable_observatory(self):
+        """ Auto-redraw preview when input values change """
+        self.observing = True
 
-    # Disable auto-update of preview
     def disable_observatory(self):
         """ Disable auto-redraw to prevent an avalanche of redraws when
         (re)setting the form
         """
-        for field in self.form_fields:
-            if field.widget_type:
-                field.widget.unbind("<FocusOut>")
-                field.widget.unbind("<Return>")
-                field.widget.unbind("<<ComboboxSelected>>")
-            # This clause is to prevent exceptions when no trace present
-            elif len(field.tk_var.trace_info()) > 0:
-                field.tk_var.trace_remove("write", field.trace_id)
+        self.observing = False
 
     # Helper functions
     def reset(self, redraw=True):
@@ -643,17 +831,41 @@ class Creator():
         if redraw:
             ack = messagebox.askokcancel("Reset", txt)
         if ack:
+            # Leave the observatory as found, reset may be part of a
+            # larger change to the form
+            observing = self.observing
             self.disable_observatory()
-            for field in self.form_fields:
-                field.tk_var.set(field.default_val)
+            for tk_var, default_val in zip(self._tk_vars, self._defaults):
+                tk_var.set(default_val)
             if redraw:
-                self.create_preview()
-            self.enable_observatory()
+                self._do_create_preview()
+            if observing:
+                self.enable_observatory()
+
+    def show_code(self, code_string):
+        """ Show code in the code pane, once that is built. Leave the
+        pane alone if it already shows this code.
+        """
+        if code_string == self.code_string and self.code_shown:
+            return
+        self.code_string = code_string
+        self.code_shown = True
+        if self.code_pane is not None:
+            self.code_pane.delete(1.0, tk.END)
+            self.code_pane.insert(1.0, code_string)
+            self.code_pane.edit_modified(False)
 
     def clear_preview_pane(self):
-        """ Delete the slider in the preview pane"""
-        for widget in self.slider_pane.winfo_children():
-            widget.destroy()
+        """ Empty the preview pane. The error label is only hidden, it
+        is kept for reuse.
+        """
+        if self.shown_widget is not None:
+            if self.shown_widget is self.error_label:
+                self.shown_widget.grid_remove()
+            else:
+                self.shown_widget.destroy()
+            self.shown_widget = None
+        self._last_kwargs = None
         # tk occasionally has some lag, preemptively set value to 0
         self.slider_value.set(0)
 
@@ -661,13 +873,10 @@ class Creator():
         """ Callback for validate, prevent empty widgets """
         return value != ""
 
-    def correct(self, formfield_index):
+    def correct(self, kwarg_name):
         """ Callback for invalidcommand: set widget to default value """
-        index = int(formfield_index)  # everything arrives as a string
-        self.form_fields[index].widget.insert(
-            0,
-            self.form_fields[index].default_val
-        )
+        field = self.fields[kwarg_name]
+        field.widget.insert(0, field.default_val)
 
     def copy_to_clipboard(self):
         """ Copy code from code pane to clipboard"""
@@ -680,21 +889,35 @@ class Creator():
         self.code_pane.focus_set()  # avoid triggering focusout
         self.code_pane.delete(1.0, tk.END)
         self.code_pane.insert(1.0, self.parent.clipboard_get(), "green")
+        self.code_shown = False
 
     def show_error(self, msg):
         """ Show error message in the preview pane """
-        # Remove existing label
+        # Remove existing label and code of the previous slider
         self.clear_preview_pane()
-        tk.Label(
-            self.slider_pane,
-            fg="red",
-            font=("Courier", 16),
-            text=msg
-        ).grid(sticky=tk.NSEW)
+        self.show_code("")
+        if self.error_label is None:
+            self.error_label = tk.Label(
+                self.slider_pane,
+                fg="red",
+                font=("Courier", 16),
+            )
+        self.error_label.configure(text=msg)
+        self.error_label.grid(row=0, column=0, sticky=tk.NSEW)
+        self.shown_widget = self.error_label
 
     def code_changed(self, *_):
         """ Change font color in code pane when user bepotles code. """
-        self.code_pane.tag_add("green", "1.0", tk.END)
+        if self.code_pane.edit_modified():
+            # Retag only when some of the text is not green yet
+            ranges = self.code_pane.tag_ranges("green")
+            if (len(ranges) != 2
+                    or self.code_pane.compare(ranges[0], ">", "1.0")
+                    or self.code_pane.compare(ranges[1], "<", "end-1c")):
+                self.code_pane.tag_add("green", "1.0", tk.END)
+            self.code_shown = False
+            # Rearm <<Modified>> for the next edit
+            self.code_pane.edit_modified(False)
 
     def on_closing(self):
         """  Let user reconsider their decision to part ways. """
@@ -705,5 +928,9 @@ class Creator():
 # Mainloop
 if __name__ == "__main__":
     root = tk.Tk()
+    # Keep the window hidden while the form and the first slider are
+    # built, show it once
+    root.withdraw()
     creator = Creator(root)
+    root.deiconify()
     root.mainloop()
@@ -13,27 +13,36 @@ PERFORMANCE OF THIS SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
+import collections
+import itertools
+import pathlib
+import types
+
 # FORMFIELDS
+# Placeholder form values that leave the choice to the slider
+AUTO = "<auto>"
+NONE = "None"
+
 # Values for comboboxes
-borders = [
+borders = (
     "flat",
     "solid",
     "raised",
     "sunken",
     "ridge",
     "groove"
-]
-thumb_styles = [
+)
+thumb_styles = (
     "classic",
     "dot",
     "diamond",
     "pointer",
     "crosshair",
     "cube",
-]
-track_styles = ["plane", "line"]
-track_backgrounds = [
-    "None",
+)
+track_styles = ("plane", "line")
+track_backgrounds = (
+    NONE,
     "green_to_red",
     "white_to_blue",
     "grey",
@@ -43,322 +52,183 @@ track_backgrounds = [
     "yellow",
     "orange",
     "pink"
-]
-precisions = ["0 (int)", "1", "2"]
-colors = [
-    "<auto>",
+)
+precisions = ("0 (int)", "1", "2")
+colors = (
+    AUTO,
     "grey",
     "red",
     "green",
     "blue",
     "#06038D",
     "#FE5BAC",
-]
-fonts = [
-    "<auto>",
+)
+fonts = (
+    AUTO,
     "Arial",
     "Courier",
     "Comic Sans MS",
     "Helvetica",
     "Times New Roman",
-]
-prefixes = [
+)
+prefixes = (
     "$",
     "€",
     "£",
     "￥",
     "±",
-    "None"
-]
-suffixes = [
+    NONE
+)
+suffixes = (
     "%",
     "‰",
     "x",
-    "None"
-]
+    NONE
+)
 
 # Formfield tooltip texts
-tip_text_0 = """Pick a gradient or named color, or: 
-                Any valid tkinter color, named or hex code."""
-tip_text_1 = """Color of ticks and thumb. 
-                Any valid tkinter color, named or hex code."""
 tip_text_2 = "Any valid tkinter color, named or hex code."
+tip_text_0 = "Pick a gradient or named color, or:\n" + tip_text_2
+tip_text_1 = "Color of ticks and thumb.\n" + tip_text_2
 tip_text_3 = "Any valid tkinter font"
 
 # Formfields
-basic_fields = [
-    # orientation
-    {
-        "kwarg_name": "orientation",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Horizontal or vertical",
-        "default_val": "horizontal",
-        "widget_type": "combo",
-        "widget_readonly": True,
-        "values": ["horizontal", "vertical"],
-    },
-    # relief
-    {
-        "kwarg_name": "relief",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Borderstyle",
-        "default_val": "flat",
-        "widget_type": "combo",
-        "widget_readonly": True,
-        "values": borders,
-    },
-    # show_top_label
-    {
-        "kwarg_name": "show_top_label",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Show current value",
-        "default_val": 1,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
-    # show_ticks
-    {
-        "kwarg_name": "show_ticks",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Show ticks",
-        "default_val": 1,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
-    # show_minor_ticks
-    {
-        "kwarg_name": "show_minor_ticks",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Show minor ticks",
-        "default_val": 0,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
-    # show_bottom_labels
-    {
-        "kwarg_name": "show_bottom_labels",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Show bottom labels",
-        "default_val": 1,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
-    # snap_to_ticks
-    {
-        "kwarg_name": "snap_to_ticks",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Snap to ticks",
-        "default_val": 0,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
+# Definition of a form field, in the order of the arguments of
+# build.Formfield after its parent
+FieldSpec = collections.namedtuple(
+    "FieldSpec",
+    (
+        "kwarg_name",
+        "kwarg_type",
+        "kwarg_label_text",
+        "default_val",
+        "tool_tip_txt",
+        "widget_type",
+        "widget_readonly",
+        "values",
+    ),
+    # tool_tip_txt, widget_type, widget_readonly and values are optional
+    defaults=(None, None, False, None),
+)
 
-]
-track_thumb_fields = [
-    # width
-    {
-        "kwarg_name": "track_length",
-        "kwarg_type": "int",
-        "kwarg_label_text": "Track length",
-        "default_val": "<auto>",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # height
-    {
-        "kwarg_name": "track_width",
-        "kwarg_type": "int",
-        "kwarg_label_text": "Track width",
-        "default_val": "<auto>",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # track_style
-    {
-        "kwarg_name": "track_style",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Track style",
-        "default_val": "plane",
-        "widget_type": "combo",
-        "widget_readonly": True,
-        "values": track_styles,
-    },
-    # track_relief
-    {
-        "kwarg_name": "track_relief",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Track relief style",
-        "default_val": "sunken",
-        "widget_type": "combo",
-        "widget_readonly": True,
-        "values": borders,
-    },
-    # thumb_style
-    {
-        "kwarg_name": "thumb_style",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Thumb style",
-        "default_val": "classic",
-        "widget_type": "combo",
-        "widget_readonly": True,
-        "values": thumb_styles,
-    }
-]
-colors_fonts_fields = [
-    # track_bg
-    {
-        "kwarg_name": "track_bg",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Track background",
-        "tool_tip_txt": tip_text_0,
-        "default_val": "None",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": track_backgrounds,
-    },
-    # color
-    {
-        "kwarg_name": "color",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Color",
-        "tool_tip_txt": tip_text_1,
-        "default_val": "<auto>",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": colors,
-    },
-    # font_color
-    {
-        "kwarg_name": "font_color",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Font color",
-        "tool_tip_txt": tip_text_2,
-        "default_val": "<auto>",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": colors,
-    },
-    # font
-    {
-        "kwarg_name": "font",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Font",
-        "tool_tip_txt": tip_text_3,
-        "default_val": "<auto>",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": fonts,
-    },
-    # font_size
-    {
-        "kwarg_name": "font_size",
-        "kwarg_type": "int",
-        "kwarg_label_text": "Font size",
-        "default_val": "<auto>",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # font bold
-    {
-        "kwarg_name": "font_bold",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Bold",
-        "default_val": 0,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
-    # font italic
-    {
-        "kwarg_name": "font_italic",
-        "kwarg_type": "bool",
-        "kwarg_label_text": "Italic",
-        "default_val": 0,
-        "widget_type": None,
-        "widget_readonly": False,
-        "values": None,
-    },
-]
-advanced_fields = [
-    # start_value
-    {
-        "kwarg_name": "start_value",
-        "kwarg_type": "float",
-        "kwarg_label_text": "Start value",
-        "default_val": "0",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # end_value
-    {
-        "kwarg_name": "end_value",
-        "kwarg_type": "float",
-        "kwarg_label_text": "End value",
-        "default_val": "100",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # initial_value
-    {
-        "kwarg_name": "initial_value",
-        "kwarg_type": "float",
-        "kwarg_label_text": "Inital value",
-        "default_val": "None",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # num_ticks
-    {
-        "kwarg_name": "num_ticks",
-        "kwarg_type": "int",
-        "kwarg_label_text": "Number of ticks",
-        "default_val": "10",
-        "widget_type": "entry",
-        "widget_readonly": False,
-        "values": None,
-    },
-    # precision
-    {
-        "kwarg_name": "precision",
-        "kwarg_type": "int",
-        "kwarg_label_text": "Precision",
-        "default_val": "0 (int)",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": precisions,
-    },
-    # prefix
-    {
-        "kwarg_name": "prefix",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Prefix",
-        "default_val": "None",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": prefixes,
-    },
-    # suffix
-    {
-        "kwarg_name": "suffix",
-        "kwarg_type": "str",
-        "kwarg_label_text": "Suffix",
-        "default_val": "None",
-        "widget_type": "combo",
-        "widget_readonly": False,
-        "values": suffixes,
-    }
-]
+
+def _bool_field(kwarg_name, kwarg_label_text, default_val=0):
+    """ Definition of a form field for a boolean, shown as checkbutton """
+    return FieldSpec(
+        kwarg_name=kwarg_name,
+        kwarg_type="bool",
+        kwarg_label_text=kwarg_label_text,
+        default_val=default_val,
+    )
+
+
+def _entry_field(kwarg_name, kwarg_type, kwarg_label_text, default_val):
+    """ Definition of a form field for free input, shown as entry """
+    return FieldSpec(
+        kwarg_name=kwarg_name,
+        kwarg_type=kwarg_type,
+        kwarg_label_text=kwarg_label_text,
+        default_val=default_val,
+        widget_type="entry",
+    )
+
+
+def _combo_field(
+        kwarg_name,
+        kwarg_type,
+        kwarg_label_text,
+        default_val,
+        values,
+        widget_readonly=False,
+        tool_tip_txt=None,
+):
+    """ Definition of a form field with a list of values to choose
+    from, shown as combobox. Only values from the list are accepted if
+    widget_readonly is set.
+    """
+    return FieldSpec(
+        kwarg_name=kwarg_name,
+        kwarg_type=kwarg_type,
+        kwarg_label_text=kwarg_label_text,
+        default_val=default_val,
+        tool_tip_txt=tool_tip_txt,
+        widget_type="combo",
+        widget_readonly=widget_readonly,
+        values=values,
+    )
+
+
+basic_fields = (
+    _combo_field(
+        "orientation", "str", "Horizontal or vertical", "horizontal",
+        ("horizontal", "vertical"), widget_readonly=True
+    ),
+    _combo_field(
+        "relief", "str", "Borderstyle", "flat",
+        borders, widget_readonly=True
+    ),
+    _bool_field("show_top_label", "Show current value", 1),
+    _bool_field("show_ticks", "Show ticks", 1),
+    _bool_field("show_minor_ticks", "Show minor ticks", 0),
+    _bool_field("show_bottom_labels", "Show bottom labels", 1),
+    _bool_field("snap_to_ticks", "Snap to ticks", 0),
+)
+track_thumb_fields = (
+    _entry_field("track_length", "int", "Track length", AUTO),
+    _entry_field("track_width", "int", "Track width", AUTO),
+    _combo_field(
+        "track_style", "str", "Track style", "plane",
+        track_styles, widget_readonly=True
+    ),
+    _combo_field(
+        "track_relief", "str", "Track relief style", "sunken",
+        borders, widget_readonly=True
+    ),
+    _combo_field(
+        "thumb_style", "str", "Thumb style", "classic",
+        thumb_styles, widget_readonly=True
+    ),
+)
+colors_fonts_fields = (
+    _combo_field(
+        "track_bg", "str", "Track background", NONE,
+        track_backgrounds, tool_tip_txt=tip_text_0
+    ),
+    _combo_field(
+        "color", "str", "Color", AUTO,
+        colors, tool_tip_txt=tip_text_1
+    ),
+    _combo_field(
+        "font_color", "str", "Font color", AUTO,
+        colors, tool_tip_txt=tip_text_2
+    ),
+    _combo_field(
+        "font", "str", "Font", AUTO,
+        fonts, tool_tip_txt=tip_text_3
+    ),
+    _entry_field("font_size", "int", "Font size", AUTO),
+    _bool_field("font_bold", "Bold", 0),
+    _bool_field("font_italic", "Italic", 0),
+)
+advanced_fields = (
+    _entry_field("start_value", "float", "Start value", "0"),
+    _entry_field("end_value", "float", "End value", "100"),
+    _entry_field("initial_value", "float", "Inital value", NONE),
+    _entry_field("num_ticks", "int", "Number of ticks", "10"),
+    _combo_field("precision", "int", "Precision", "0 (int)", precisions),
+    _combo_field("prefix", "str", "Prefix", NONE, prefixes),
+    _combo_field("suffix", "str", "Suffix", NONE, suffixes),
+)
+# Form sections in form order, each shown in its own tab
+sections = (
+    basic_fields,
+    track_thumb_fields,
+    colors_fonts_fields,
+    advanced_fields,
+)
+# All form fields, and each form field by kwarg_name
+all_fields = tuple(itertools.chain.from_iterable(sections))
+fields_by_name = {spec.kwarg_name: spec for spec in all_fields}
 
 # PREBUILT SLIDERS
 prebuilts = {
@@ -413,61 +283,32 @@ prebuilts = {
     },
 }
 
-# HELP TEXT
-help_text = """# Minimal implementation:
-
-import tkinter as tk
-from slider import Slider
-
-
-root = tk.Tk()
 
-my_slider = Slider(
-    root,
-    # options
-)
-my_slider.pack()
-
-tk.Button(
-    text="Disable",
-    command=lambda: my_slider.disable()
-).pack(side=tk.RIGHT)
-
-tk.Button(
-    text="Enable",
-    command=lambda: my_slider.enable()
-).pack(side=tk.RIGHT)
-
-get_var = tk.IntVar()
-tk.Label(
-    width=5,
-    textvariable=get_var,
-    fg="blue",
-    anchor=tk.W
-).pack(side=tk.RIGHT)
+def _check_prebuilts(prebuilts):
+    """ Raise ValueError if a prebuilt uses a kwarg without form field """
+    for name, args in prebuilts.items():
+        unknown = args.keys() - fields_by_name.keys()
+        if unknown:
+            raise ValueError(
+                f"Prebuilt {name!r} has unknown options: {sorted(unknown)}"
+            )
 
-tk.Button(
-    text="Get >",
-    command=lambda: get_var.set(my_slider.get())
-).pack(side=tk.RIGHT)
 
-tk.Button(
-    text="< Set",
-    command=lambda: my_slider.set(entry.get())
-).pack(side=tk.RIGHT)
+# Catch typos in prebuilts once, when config is imported
+_check_prebuilts(prebuilts)
+# Prebuilts are shared by all users of config, make them read-only
+prebuilts = types.MappingProxyType({
+    name: types.MappingProxyType(args) for name, args in prebuilts.items()
+})
 
-entry = tk.Entry(width=5, fg="blue")
-entry.pack(side=tk.RIGHT)
-tk.Label(text="Enter a value:").pack(side=tk.RIGHT)
 
-tk.Label(
-    textvariable=my_slider.value,
-    width=6,
-    fg="blue",
-    anchor=tk.W,
-).pack(side=tk.RIGHT)
-tk.Label(text="Current value:").pack(side=tk.RIGHT)
-
-root.mainloop()
-
-"""
\ No newline at end of file
+# HELP TEXT
+# help_text is read from help_text.txt when first used
+def __getattr__(name):
+    """ Load rarely needed module attributes on first access """
+    if name == "help_text":
+        path = pathlib.Path(__file__).with_name("help_text.txt")
+        value = path.read_text(encoding="utf-8")
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
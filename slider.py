@@ -23,6 +23,7 @@ Public class: Slider
 
 import warnings
 import decimal
+import functools
 from decimal import Decimal
 import tkinter as tk
 import tkinter.font as tk_font
@@ -32,6 +33,77 @@ MOUSE_WHEEL = "<MouseWheel>"
 BUTTON = "<Button>"
 MOTION = "<Motion>"
 BUTTON_RELEASE = "<ButtonRelease>"
+MAP = "<Map>"
+DESTROY = "<Destroy>"
+
+# Tcl lambda creating a text item per label on canvas w in a single
+# call. coords is a flat list x1 y1 x2 y2 ..., texts has one entry per
+# label.
+_CREATE_LABELS = (
+    "{w coords texts fill font tags} {"
+    "foreach {x y} $coords text $texts {"
+    "$w create text $x $y -text $text -fill $fill -font $font"
+    " -tags $tags -anchor center"
+    "}}"
+)
+
+# Types of tk variables accepted as subscriber
+SUBSCRIBER_TYPES = (tk.IntVar, tk.DoubleVar)
+
+# Fonts and their line height by (Tcl interpreter, name, size, bold,
+# italic), shared by all sliders using the same font in the same Tk
+# application. A font only exists in the interpreter it was created in.
+_FONT_CACHE = {}
+
+
+def _get_font(master, name, size, bold, italic):
+    """ Return the shared tk font for the arguments and its line height.
+    Creating a font and measuring it are relatively slow Tk calls.
+    """
+    key = (master.tk, name, size, bold, italic)
+    if key not in _FONT_CACHE:
+        font = tk_font.Font(root=master, font=(name, size))
+        if bold:
+            font.config(weight="bold")
+        if italic:
+            font.config(slant="italic")
+        _FONT_CACHE[key] = (font, font.metrics("linespace"))
+    return _FONT_CACHE[key]
+
+
+@functools.lru_cache(maxsize=32)
+def _gradient_colors(track_bg, count, step):
+    """ Return count colors of a named gradient, changing by step per
+    color. Cached, as sliders are often recreated with the same
+    gradient.
+    """
+    if track_bg == "green_to_red":
+        # Start green, increase red until 255, then decrease green
+        # until 0. Each color is computed directly from its position.
+        return tuple(
+            f"#{int(min(i * step, 255)):02x}"
+            f"{int(max(min(510 - (i + 1) * step, 255), 0)):02x}00"
+            for i in range(count)
+        )
+    # white_to_blue: start white, decrease red and green
+    return tuple(
+        f"#{level:02x}{level:02x}ff"
+        for level in (int(max(255 - i * step, 0)) for i in range(count))
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _label_texts(value_format, first_value, step, count):
+    """ Return count label texts, starting at first_value and changing by
+    step per label. Cached, as sliders often share their range and
+    format.
+    """
+    format_value = value_format.format
+    # Compute each value from its index, adding up steps would
+    # accumulate rounding errors
+    return tuple(
+        format_value(first_value + i * step) for i in range(count)
+    )
 
 
 class Slider(tk.Frame):
@@ -129,7 +201,7 @@ class Slider(tk.Frame):
         super().__init__(parent, bd=3, pady=5, padx=5, relief=relief)
 
         # Create model & controller
-        self.model = _SliderModel(**kwargs)
+        self.model = _SliderModel(self, **kwargs)
         self.engine = _SliderEngine(self.model)
 
         # Create graphical elements, top to bottom
@@ -184,7 +256,58 @@ class _SliderModel:
     disable(): set colors to "grey" to indicate disabled state
     enable(): set colors to requested value
     """
-    def __init__(self, **kwargs):
+    __slots__ = (
+        "orientation",
+        "track_style",
+        "track_relief",
+        "thumb_style",
+        "track_bg",
+        "show_minor_ticks",
+        "snap_to_ticks",
+        "precision",
+        "start_value",
+        "end_value",
+        "initial_value",
+        "prefix",
+        "suffix",
+        "value_format",
+        "format_value",
+        "min_value",
+        "max_value",
+        "num_ticks",
+        "tick_width_num",
+        "font",
+        "font_size",
+        "font_color_requested",
+        "font_color",
+        "color_requested",
+        "color",
+        "length",
+        "width",
+        "track_padding",
+        "tick_width",
+        "tick_start",
+        "bar_pad_y",
+        "bar_pad_x",
+        "outer_padding",
+        "displacement_to_value",
+        "pack_side",
+        "label_bar_width",
+        "label_bar_height",
+        "top_label_bar_height",
+        "top_label_width",
+        "top_label_height",
+        "track_width",
+        "track_height",
+        "thumb_width",
+        "thumb_height",
+        "tick_bar_width",
+        "tick_bar_height",
+        "text_start_x",
+        "text_start_y",
+    )
+
+    def __init__(self, master, **kwargs):
         orientation = kwargs.get('orientation', 'horizontal')
         track_style = kwargs.get('track_style', 'plane')
         track_relief = kwargs.get('track_relief', 'sunken')
@@ -232,6 +355,14 @@ class _SliderModel:
             self.initial_value = initial_value
         self.prefix = prefix
         self.suffix = suffix
+        # Format a value as label text, the format string is built once.
+        # Braces in prefix or suffix are escaped to be taken literally.
+        self.value_format = "".join((
+            prefix.replace("{", "{{").replace("}", "}}"),
+            f"{{:.{precision}f}}",
+            suffix.replace("{", "{{").replace("}", "}}"),
+        ))
+        self.format_value = self.value_format.format
 
         # min/max for clamp as range may be descending
         self.min_value = min(self.start_value, self.end_value)
@@ -250,10 +381,6 @@ class _SliderModel:
             txt = f"Too many ticks set, adjusted to {self.num_ticks}"
             warnings.warn(txt)
 
-        # Set precision of return value to None to prevent round()
-        # from returning a decimal when set precision == 0
-        self.ret_val_precision = self.precision or None
-
         """ Set font and font-size specific attributes """
         font_name = font or "TkDefaultFont"
         self.font_size = font_size
@@ -268,21 +395,13 @@ class _SliderModel:
             )
 
         # Finalize font
-        self.font = tk_font.Font(font=(font_name, self.font_size))
-        if font_bold:
-            self.font.config(weight="bold")
-        if font_italic:
-            self.font.config(slant="italic")
-
-        # Get dimensions of the longest possible text. Note this might
-        # be the lowest value if negative (e.g. slider range -1, 0)
-        long_value = self.max_value if (
-                len(f"{self.max_value}") > len(f"{self.min_value}")
-        ) else self.min_value
-
-        text = f"{self.prefix}{long_value}{self.suffix}"
-        max_text_width = self.font.measure(text) + 30  # don't ask
-        text_height = self.font.metrics("linespace")
+        self.font, text_height = _get_font(
+            master,
+            font_name,
+            self.font_size,
+            font_bold,
+            font_italic
+        )
 
         """ Set color of thumb and ticks """
         self.color_requested = color
@@ -371,6 +490,14 @@ class _SliderModel:
             if self.track_style == "plane":
                 # Compensate track border (3) + padding (4)
                 self.bar_pad_y = 7
+            # Labels are side by side with the track, measure the
+            # longest possible text. Note this might be the lowest value
+            # if negative (e.g. slider range -1, 0)
+            long_value = self.max_value if (
+                    len(f"{self.max_value}") > len(f"{self.min_value}")
+            ) else self.min_value
+            text = f"{self.prefix}{long_value}{self.suffix}"
+            max_text_width = self.font.measure(text) + 30  # don't ask
             self.label_bar_width = max_text_width
             self.label_bar_height = self.length
             self.top_label_bar_height = self.label_bar_height
@@ -403,33 +530,91 @@ class _SliderEngine:
     stop(): disable user interaction, slider can be set though
     set(): set slider value programmatically
     add_subscriber(): ad a custom tk variable to be auto-updated
+    Slider elements append a callback to observers to be called with
+    the new slider_value and its position along the track whenever it
+    changes.
     """
+    __slots__ = (
+        "model",
+        "trace_ids",
+        "subscribers",
+        "tick_width_dec",
+        "min_value",
+        "max_value",
+        "displacement_to_value",
+        "tick_width_num",
+        "half_tick_width",
+        "position_origin",
+        "value_to_position",
+        "state",
+        "active",
+        "slider_value",
+        "observers",
+        "on_tick",
+        "ret_val",
+        "_last_ret_val",
+        "slide",
+        "slide_snapped",
+        "traced_vars",
+        "funcs",
+    )
+
     def __init__(self, model):
         self.model = model
         self.trace_ids = []
-        self.subscriber = None
+        # Subscribed tk variables by name, tk.Variable is unhashable
+        self.subscribers = {}
 
         # Init context and static helper var for decimal calculations
         decimal.getcontext().rounding = decimal.ROUND_HALF_UP
         self.tick_width_dec = Decimal(f"{self.model.tick_width_num}")
+        # Static values used on every slide, kept close at hand
+        self.min_value = self.model.min_value
+        self.max_value = self.model.max_value
+        self.displacement_to_value = self.model.displacement_to_value
+        self.tick_width_num = self.model.tick_width_num
+        self.half_tick_width = 0.5 * self.model.tick_width_num
+        # Position along the track is counted from the start value
+        # for a horizontal slider, from the end value for a vertical one
+        if self.model.orientation == "horizontal":
+            self.position_origin = self.model.start_value
+            self.value_to_position = 1 / self.model.displacement_to_value
+        else:
+            self.position_origin = self.model.end_value
+            self.value_to_position = -1 / self.model.displacement_to_value
 
-        # on/off switch of the whole thing
+        # on/off switch of the whole thing, mirrored as a plain bool
+        # for mouse wheel events, which bypass the tk variables below
         self.state = tk.BooleanVar()
-        # Current internal value of the slider
-        self.slider_value = tk.DoubleVar()
-        # Create return value and trace slider_value to auto-update it
-        self.ret_val = tk.DoubleVar() if self.model.precision else tk.IntVar()
-        self.slider_value.trace_add("write", self._set_ret_val)
+        self.active = False
+        # Current internal value of the slider, a plain number as it
+        # changes with every mouse movement. Changes are passed on to
+        # the observers.
+        self.slider_value = 0.0
+        self.observers = []
+        # Whether slider_value is on a tick, None if not known. Set
+        # along with slider_value, checked when needed.
+        self.on_tick = None
+        # Create return value and have it follow slider_value, set only
+        # when the rounded value changes. Precision is fixed, so pick the
+        # matching variable type and update method once.
+        self._last_ret_val = None
+        if self.model.precision:
+            self.ret_val = tk.DoubleVar()
+            self.observers.append(self._set_ret_val_float)
+        else:
+            self.ret_val = tk.IntVar()
+            self.observers.append(self._set_ret_val_int)
 
         # Slider elements will set one of the following vars to
         # communicate requested displacement, each one is bound to a
-        # specific method in self.start()
+        # specific method in self.start(). Mouse wheel events call
+        # on_wheel() directly.
         self.slide = tk.IntVar()
-        self.slide_fast = tk.IntVar()
         self.slide_snapped = tk.IntVar()
 
-        self.traced_vars = (self.slide, self.slide_fast, self.slide_snapped)
-        self.funcs = (self._slide, self._slide_fast, self._slide_snapped)
+        self.traced_vars = (self.slide, self.slide_snapped)
+        self.funcs = (self._slide, self._slide_snapped)
 
     def start(self):
         """ Enable the slider by setting a trace on the variables
@@ -439,6 +624,7 @@ class _SliderEngine:
         """
         if not self.state.get():
             self.model.enable()
+            self.active = True
             self.state.set(True)
             self.trace_ids = [
                 var.trace_add("write", func)
@@ -455,54 +641,56 @@ class _SliderEngine:
         """
         if self.state.get():
             self.model.disable()
+            self.active = False
             self.state.set(False)
             for var, trace_id in zip(self.traced_vars, self.trace_ids):
                 var.trace_remove("write", trace_id)
         else:
             warnings.warn("Attempt to disable already disabled slider.")
 
+    def on_wheel(self, event):
+        """ Pass a mouse wheel event on as fast slide. Bound by all
+        slider elements, ignored when the slider is disabled.
+        """
+        if self.active:
+            self._slide_fast(event.delta)
+
     def _slide(self, *_):
         """ Change slider_value proportional to displacement.
         Use case: simple sliding left or right.
         """
-        self.slider_value.set(
+        self._set_value(
             self._clamp(
-                    self.slider_value.get()
-                    + (self.slide.get()
-                       * self.model.displacement_to_value)
+                self.slider_value
+                + self.slide.get() * self.displacement_to_value
             )
         )
 
-    def _slide_fast(self, *_):
+    def _slide_fast(self, displacement):
         """ Change slider_value in units of tick width per unit of
         displacement.
         Use case: accelerated sliding with mousewheel or trackpad
         """
-        if self.slider_value.get() == self._snap(self.slider_value.get()):
+        value = self.slider_value
+        snap = self._snap
+        on_tick = self.on_tick
+        if on_tick is None:
+            on_tick = value == snap(value)
+        if on_tick:
             # Slider is snapped, change slider_value in units of
             # numerical tick width
-            self.slider_value.set(
-                self._clamp(
-                    self.slider_value.get()
-                    + self.slide_fast.get()
-                    * self.model.tick_width_num
-                )
-            )
+            self._set_tick_value(value + displacement * self.tick_width_num)
         else:
             # Slider is not snapped. Snap to nearest higher tick value
             # if movement is upwards, snap to nearest lower tick value
             # if movement is downwards.
-            self.slider_value.set(
-                self._clamp(
-                    # Bump 0.5 tick width in the direction of travel,
-                    # snap() will finish the job
-                    self._snap(
-                        self.slider_value.get()
-                        + (-1 if self.slide_fast.get() < 0 else 1)
-                        * 0.5 * self.model.tick_width_num
-                    )
-                )
+            # Bump 0.5 tick width in the direction of travel, snap()
+            # will finish the job
+            bump = (
+                -self.half_tick_width if displacement < 0
+                else self.half_tick_width
             )
+            self._set_tick_value(snap(value + bump))
 
     def _slide_snapped(self, *_):
         """ Change slider_value proportional to displacement and snap it
@@ -510,18 +698,18 @@ class _SliderEngine:
         Use case: automatically snap the slider when clicking the
         track.
         """
-        self.slider_value.set(
-            self._clamp(
-                # Move to clicked position in track, bump 0.5 tick_width
-                # in the direction of travel and snap() will finish the
-                # job
-                self._snap(
-                    self.slider_value.get()
-                    + (self.slide_snapped.get()
-                       * self.model.displacement_to_value)
-                    + (-1 if self.slide_snapped.get() < 0 else 1)
-                    * 0.5 * self.model.tick_width_num
-                )
+        displacement = self.slide_snapped.get()
+        # Move to clicked position in track, bump 0.5 tick_width in the
+        # direction of travel and snap() will finish the job
+        bump = (
+            -self.half_tick_width if displacement < 0
+            else self.half_tick_width
+        )
+        self._set_tick_value(
+            self._snap(
+                self.slider_value
+                + displacement * self.displacement_to_value
+                + bump
             )
         )
 
@@ -530,9 +718,7 @@ class _SliderEngine:
         Use case: Snap the slider upon button release (after dragging)
         when snap_to_tick option is set.
         """
-        self.slider_value.set(
-            self._snap(self.slider_value.get())
-        )
+        self._set_value(self._snap(self.slider_value), on_tick=True)
 
     def set(self, value):
         """ Set slider programmatically """
@@ -550,19 +736,50 @@ class _SliderEngine:
             raise ValueError(txt)
 
         if self.model.snap_to_ticks:
-            self.slider_value.set(self._snap(requested_value))
+            self._set_value(self._snap(requested_value), on_tick=True)
         else:
-            self.slider_value.set(requested_value)
+            self._set_value(requested_value)
 
-    def _set_ret_val(self, *_):
-        """ Set return value rounded to set precision. """
-        self.ret_val.set(
-            round(self.slider_value.get(), self.model.ret_val_precision)
-        )
+    def _set_tick_value(self, value):
+        """ Set slider_value to value, which is on a tick, unless it
+        needs clamping.
+        """
+        clamped = self._clamp(value)
+        self._set_value(clamped, on_tick=True if clamped == value else None)
+
+    def _set_value(self, value, on_tick=None):
+        """ Set slider_value and notify the observers. The position is
+        computed once for all of them.
+        on_tick tells whether value is known to be on a tick, None if
+        unknown.
+        """
+        self.slider_value = value
+        self.on_tick = on_tick
+        position = (value - self.position_origin) * self.value_to_position
+        for observer in self.observers:
+            observer(value, position)
+
+    def _set_ret_val_int(self, value, _position):
+        """ Set return value rounded to an integer, if changed. """
+        ret_val = round(value)
+        if ret_val != self._last_ret_val:
+            self._last_ret_val = ret_val
+            self.ret_val.set(ret_val)
+            for var in self.subscribers.values():
+                var.set(ret_val)
+
+    def _set_ret_val_float(self, value, _position):
+        """ Set return value rounded to set precision, if changed. """
+        ret_val = round(value, self.model.precision)
+        if ret_val != self._last_ret_val:
+            self._last_ret_val = ret_val
+            self.ret_val.set(ret_val)
+            for var in self.subscribers.values():
+                var.set(ret_val)
 
     def _clamp(self, num):
         """ Keep slider value in between start- and end value. """
-        return min(max(self.model.min_value, num), self.model.max_value)
+        return min(max(self.min_value, num), self.max_value)
 
     def _snap(self, value):
         """ Return the numeric value of the tick nearest to value. """
@@ -582,13 +799,11 @@ class _SliderEngine:
 
     def add_subscriber(self, var):
         """ Add your own tk variable to be automatically set to current
-        value of the slider.
+        value of the slider. Adding the same variable again only
+        reinitializes it.
         """
-        if isinstance(var, (tk.IntVar, tk.DoubleVar)):
-            self.ret_val.trace_add(
-                "write",
-                lambda *_: var.set(self.ret_val.get())
-            )
+        if isinstance(var, SUBSCRIBER_TYPES):
+            self.subscribers[str(var)] = var
             # Initialize external var
             var.set(self.ret_val.get())
         else:
@@ -618,64 +833,65 @@ class _TopLabel:
         self.bar.pack()
 
         # Catch mouse wheel events in label bar for usability
-        self.bar.bind(
-            MOUSE_WHEEL,
-            lambda event: self.engine.slide_fast.set(event.delta)
-        )
+        self.bar.bind(MOUSE_WHEEL, self.engine.on_wheel)
+
+        # The label is a single text item, updated in place
+        self._last_text = None
+        self._last_coords = None
 
         # Set orientation-appropriate update function
         if self.model.orientation == "horizontal":
             self._set = self._set_hor
+            anchor = tk.CENTER
         elif self.model.orientation == "vertical":
             self._set = self._set_vert
+            anchor = tk.W
 
-        # Redraw self when slider value has changed or slider is
-        # disabled / enabled
-        for var in (self.engine.state, self.engine.slider_value):
-            var.trace_add("write", self._set)
-
-    def _set_hor(self, *_):
-        """ Update top label of horizontal slider. """
-        self.bar.delete("top_label_txt")
-        self.bar.create_text(
-            (
-                (self.engine.slider_value.get() - self.model.start_value)
-                / self.model.displacement_to_value
-                + self.model.text_start_x
-            ),
-            self.model.top_label_bar_height * 0.5,
-            text=(
-                f"{self.model.prefix}"
-                f"{self.engine.slider_value.get():.{self.model.precision}f}"
-                f"{self.model.suffix}"
-            ),
+        self.text = self.bar.create_text(
+            0,
+            0,
             tags="top_label_txt",
             font=self.model.font,
             fill=self.model.font_color,
-            anchor=tk.CENTER
+            anchor=anchor,
         )
 
-    def _set_vert(self, *_):
+        # Update self when slider value has changed, recolor self when
+        # slider is disabled / enabled
+        self.engine.observers.append(self._set)
+        self.engine.state.trace_add("write", self._set_color)
+
+    def _set_hor(self, value, position):
+        """ Update top label of horizontal slider. """
+        self._update(
+            position + self.model.text_start_x,
+            self.model.top_label_bar_height * 0.5,
+            value
+        )
+
+    def _set_vert(self, value, position):
         """ Update top label of vertical slider. """
-        self.bar.delete("top_label_txt")
-        self.bar.create_text(
+        self._update(
             self.model.text_start_x,
-            (
-                (self.model.end_value - self.engine.slider_value.get())
-                / self.model.displacement_to_value
-                + self.model.text_start_y
-            ),
-            text=(
-                f"{self.model.prefix}"
-                f"{self.engine.slider_value.get():.{self.model.precision}f}"
-                f"{self.model.suffix}"
-            ),
-            tags="top_label_txt",
-            font=self.model.font,
-            fill=self.model.font_color,
-            anchor=tk.W,
+            position + self.model.text_start_y,
+            value
         )
 
+    def _update(self, x, y, value):
+        """ Move and relabel the text item, skip what did not change. """
+        coords = (round(x), round(y))
+        if coords != self._last_coords:
+            self._last_coords = coords
+            self.bar.coords(self.text, coords)
+        text = self.model.format_value(value)
+        if text != self._last_text:
+            self._last_text = text
+            self.bar.itemconfigure(self.text, text=text)
+
+    def _set_color(self, *_):
+        """ Recolor top label when slider is disabled / enabled. """
+        self.bar.itemconfigure(self.text, fill=self.model.font_color)
+
 
 class _Track:
     """ Create the slider track, the thumb and the track background. """
@@ -683,6 +899,10 @@ class _Track:
         self.model = model
         self.engine = engine
         self.track_clicked = False
+        # Drag displacement not yet passed on to the engine, and the id
+        # of the idle callback that will pass it on
+        self._drag_delta = 0
+        self._drag_after = None
 
         # Create generic track
         track_frame = tk.Frame(
@@ -706,15 +926,13 @@ class _Track:
         self.track.pack()
 
         # Catch mouse wheel events in track for usability
-        self.track.bind(
-            MOUSE_WHEEL,
-            lambda event: self.engine.slide_fast.set(event.delta)
-        )
+        self.track.bind(MOUSE_WHEEL, self.engine.on_wheel)
+        # A pending drag must not outlive the track
+        self.track.bind(DESTROY, self._cancel_drag, add="+")
 
         # Reconfigure track if style applies
         if self.model.track_style == "line":
-            track_frame["relief"] = tk.FLAT
-            track_frame["bd"] = 0
+            track_frame.configure(relief=tk.FLAT, bd=0)
             self._draw_line()
 
             # Redraw self when slider is disabled/enabled
@@ -752,8 +970,8 @@ class _Track:
         self.track_clicked = True
         self.drag_start_x = event.x_root
 
-        delta_x = event.x - self.thumb.position.get()
-        if event.x > self.thumb.position.get():
+        delta_x = event.x - self.thumb.position
+        if event.x > self.thumb.position:
             # Clicked to the right of thumb, subtract thumb width
             # to prevent awkwardly big jump of the thumb
             delta_x -= self.model.thumb_width
@@ -767,8 +985,8 @@ class _Track:
         self.track_clicked = True
         self.drag_start_y = event.y_root
 
-        delta_y = self.thumb.position.get() - event.y
-        if event.y > self.thumb.position.get():
+        delta_y = self.thumb.position - event.y
+        if event.y > self.thumb.position:
             # Clicked below thumb, add thumb width
             # to prevent awkwardly big jump of the thumb
             delta_y += self.model.thumb_height
@@ -779,20 +997,44 @@ class _Track:
     def _move_hor(self, event):
         """ The mouse is moving in the track. If clicked, drag thumb."""
         if self.track_clicked:
-            # Simple dragging, so set 'slide'
-            self.engine.slide.set(event.x_root - self.drag_start_x)
+            # Simple dragging, so 'slide'
+            self._drag(event.x_root - self.drag_start_x)
             self.drag_start_x = event.x_root
 
     def _move_vert(self, event):
         """ The mouse is moving in the track. If clicked, drag thumb."""
         if self.track_clicked:
-            # Simple dragging, so set 'slide'
-            self.engine.slide.set(self.drag_start_y - event.y_root)
+            # Simple dragging, so 'slide'
+            self._drag(self.drag_start_y - event.y_root)
             self.drag_start_y = event.y_root
 
+    def _drag(self, delta):
+        """ Collect drag displacement. Mouse motion can be reported far
+        more often than the slider can be redrawn, so pass it on to the
+        engine once per idle cycle.
+        """
+        self._drag_delta += delta
+        if self._drag_after is None:
+            self._drag_after = self.track.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        """ Pass collected drag displacement on to the engine. """
+        self._drag_after = None
+        delta, self._drag_delta = self._drag_delta, 0
+        if delta:
+            self.engine.slide.set(delta)
+
+    def _cancel_drag(self, *_):
+        """ Cancel the scheduled pass on of drag displacement. """
+        if self._drag_after is not None:
+            self.track.after_cancel(self._drag_after)
+            self._drag_after = None
+
     def _release(self, *_):
         """ Button released, stop dragging and snap if appropriate. """
         self.track_clicked = False
+        self._cancel_drag()
+        self._flush_drag()
         if self.model.snap_to_ticks:
             self.engine.snap_slider()
 
@@ -830,155 +1072,167 @@ class _TrackBackground:
         # Gradient bg:
         if self.model.track_bg == "green_to_red":
             self.step_size = 510 / self.model.length
-            self.draw_bg = (
-                self._draw_green_to_red_hor
-                if self.model.orientation == "horizontal"
-                else self._draw_green_to_red_vert
-            )
+            self._init_gradient()
+            # Vertical gradient reaches up to the top of the thumb
+            self.gradient_offset = 0
         elif self.model.track_bg == "white_to_blue":
             self.step_size = 200 / self.model.length
-            self.draw_bg = (
-                self._draw_white_to_blue_hor
-                if self.model.orientation == "horizontal"
-                else self._draw_white_to_blue_vert
-            )
-        # Solid bg:
+            self._init_gradient()
+            # Vertical gradient reaches up to the middle of the thumb
+            self.gradient_offset = 0.5 * self.model.thumb_height
+        # Solid bg, a single rectangle resized to follow the thumb:
         else:
             self.bg_color = self.model.track_bg
-            self.draw_bg = (
-                self._draw_solid_bg_hor
-                if self.model.orientation == "horizontal"
-                else self._draw_solid_bg_vert
+            if self.model.orientation == "horizontal":
+                self.draw_bg = self._draw_solid_bg_hor
+                outline = self.bg_color
+            else:
+                self.draw_bg = self._draw_solid_bg_vert
+                outline = "black"
+            self.rectangle = self.track.create_rectangle(
+                0,
+                0,
+                0,
+                0,
+                fill=self.bg_color,
+                outline=outline,
+                tags="track_bg"
             )
         self.draw_bg()
 
-        # Trace thumb position to auto-update background
-        self.thumb.position.trace_add("write", self.draw_bg)
+        # Observe thumb position to auto-update background, at most
+        # once per idle cycle. A pending redraw must not outlive the
+        # track.
+        self._draw_after = None
+        self.thumb.observers.append(self._schedule_draw)
+        self.track.bind(DESTROY, self._cancel_draw, add="+")
 
         # Redraw self when slider is disabled/enabled
         self.engine.state.trace_add("write", self._toggle_state)
 
-    def _draw_green_to_red_hor(self, *_):
-        """ Draw gradient background, green to red """
-        # Start green, decrease green and increase red. Some tweaks
-        # for smoothness
-        self.track.delete("track_bg")
-        r = 0
-        g = 255
-        b = 0
-        for x in range(int(self.thumb.position.get())):
-            self.track.create_line(
-                x,
-                0,
-                x,
-                self.model.track_height,
-                fill=f"#{int(r):02x}{int(g):02x}{int(b):02x}",
-                tags="track_bg"
+    def _schedule_draw(self, *_):
+        """ Schedule a redraw of the background for when Tk is idle.
+        The thumb may move several times before then.
+        """
+        if self._draw_after is None:
+            self._draw_after = self.track.after_idle(self._scheduled_draw)
+
+    def _scheduled_draw(self):
+        """ Redraw the background as scheduled. """
+        self._draw_after = None
+        self.draw_bg()
+
+    def _cancel_draw(self, *_):
+        """ Cancel the scheduled redraw. """
+        if self._draw_after is not None:
+            self.track.after_cancel(self._draw_after)
+            self._draw_after = None
+
+    def _init_gradient(self):
+        """ Render the gradient once into an image the size of the
+        track. Drawing the background then only copies the part up to
+        the thumb into the image shown in the track.
+        """
+        width = self.model.track_width
+        height = self.model.track_height
+        self.gradient = tk.PhotoImage(
+            master=self.track,
+            width=width,
+            height=height
+        )
+        self.shown = tk.PhotoImage(
+            master=self.track,
+            width=width,
+            height=height
+        )
+        if self.model.orientation == "horizontal":
+            # One row, left to right, repeated over the track height
+            colors = _gradient_colors(
+                self.model.track_bg,
+                width,
+                self.step_size
             )
-            if r <= 255 - self.step_size:
-                r += self.step_size
-            elif r < 255:  # push to 255 if step_size too large
-                r = 255
-            if r >= 255:
-                g -= self.step_size
-
-    def _draw_white_to_blue_hor(self, *_):
-        """ Draw gradient background, white to blue """
-        # Start white, decrease red and green
-        self.track.delete("track_bg")
-        r = g = b = 255
-        for x in range(int(self.thumb.position.get())):
-            self.track.create_line(
-                x,
-                0,
-                x,
-                self.model.track_height,
-                fill=f"#{int(r):02x}{int(g):02x}{int(b):02x}",
-                tags="track_bg"
+            self.gradient.put(
+                "{" + " ".join(colors) + "}",
+                to=(0, 0, width, height)
             )
-            if r > 0 + self.step_size:
-                r -= self.step_size
-                g -= self.step_size
-
-    def _draw_green_to_red_vert(self, *_):
-        """ Draw gradient background, green to red """
-        # Start green, decrease green and increase red. Some tweaks
-        # for smoothness
-        self.track.delete("track_bg")
-        r = b = 0
-        g = 255
-        for y in range(
-                self.model.track_height,
-                int(self.thumb.position.get()),
-                -1
-        ):
-            self.track.create_line(
-                0,
-                y,
-                self.model.track_width,
-                y,
-                fill=f"#{int(r):02x}{int(g):02x}{int(b):02x}",
-                tags="track_bg"
+            self.draw_bg = self._draw_gradient_hor
+        else:
+            # One column, bottom to top, repeated over the track width.
+            # Row y shows color number height - y, counting from 0 at
+            # the (invisible) row y == height.
+            colors = _gradient_colors(
+                self.model.track_bg,
+                height + 1,
+                self.step_size
             )
-            if r <= 255 - self.step_size:
-                r += self.step_size
-            elif r < 255:  # push to 255 if step_size too large
-                r = 255
-            if r >= 255:
-                g -= self.step_size
-
-    def _draw_white_to_blue_vert(self, *_):
-        """ Draw gradient background, white to blue """
-        # Start white, decrease red and green
-        self.track.delete("track_bg")
-        r = g = b = 255
-        for y in range(
-                self.model.track_height,
-                int(self.thumb.position.get() + 0.5 * self.model.thumb_height),
-                -1
-        ):
-            self.track.create_line(
-                0,
-                y,
-                self.model.track_width,
-                y,
-                fill=f"#{int(r):02x}{int(g):02x}{int(b):02x}",
-                tags="track_bg"
+            self.gradient.put(
+                " ".join("{" + color + "}" for color in colors[:0:-1]),
+                to=(0, 0, width, height)
+            )
+            self.draw_bg = self._draw_gradient_vert
+        self.track.create_image(
+            0,
+            0,
+            anchor=tk.NW,
+            image=self.shown,
+            tags="track_bg"
+        )
+
+    def _draw_gradient_hor(self, *_):
+        """ Draw gradient background from the left up to the thumb """
+        self.shown.blank()
+        right = int(self.thumb.position)
+        if right > 0:
+            self.shown.tk.call(
+                self.shown,
+                "copy",
+                self.gradient,
+                "-from", 0, 0, right, self.model.track_height,
+                "-to", 0, 0,
+            )
+
+    def _draw_gradient_vert(self, *_):
+        """ Draw gradient background from the bottom up to the thumb """
+        self.shown.blank()
+        top = int(self.thumb.position + self.gradient_offset) + 1
+        if top < self.model.track_height:
+            self.shown.tk.call(
+                self.shown,
+                "copy",
+                self.gradient,
+                "-from", 0, top,
+                self.model.track_width, self.model.track_height,
+                "-to", 0, top,
             )
-            if r > 0 + self.step_size:
-                r -= self.step_size
-                g -= self.step_size
 
     def _draw_solid_bg_hor(self, *_):
         """ Draw a solid background for horizontal slider. """
-        self.track.delete("track_bg")
-        self.track.create_rectangle(
+        self.track.coords(
+            self.rectangle,
             0,
             0,
-            int(self.thumb.position.get()),
+            int(self.thumb.position),
             self.model.track_height,
-            fill=self.bg_color,
-            outline=self.bg_color,
-            tags="track_bg"
         )
 
     def _draw_solid_bg_vert(self, *_):
         """ Draw a solid background for a vertical slider. """
-        self.track.delete("track_bg")
-        self.track.create_rectangle(
+        self.track.coords(
+            self.rectangle,
             0,
-            int(self.thumb.position.get()) + self.model.thumb_height,
+            int(self.thumb.position) + self.model.thumb_height,
             self.model.track_width,
             self.model.track_height,
-            fill=self.bg_color,
-            tags="track_bg"
         )
 
     def _toggle_state(self, *_):
+        """ Show background only while the slider is enabled. """
         if self.engine.state.get():
+            self.track.itemconfigure("track_bg", state=tk.NORMAL)
             self.draw_bg()
         else:
-            self.track.delete("track_bg")
+            self.track.itemconfigure("track_bg", state=tk.HIDDEN)
 
 
 class _Thumb:
@@ -988,8 +1242,19 @@ class _Thumb:
         self.model = model
         self.engine = engine
 
-        self.position = tk.DoubleVar()
+        # Position of the thumb in the track, observers are called with
+        # the new position when the thumb moves
+        self.position = 0.0
+        self.observers = []
+        # Pixel the thumb was last moved to
+        self._last_pixel = None
         self._clicked = False
+        # Drag displacement not yet passed on to the engine, and the id
+        # of the idle callback that will pass it on
+        self._drag_delta = 0
+        self._drag_after = None
+        # A pending drag must not outlive the track
+        self.parent.bind(DESTROY, self._cancel_drag, add="+")
 
         # Create generic thumb frame
         self.thumb_frame = tk.Frame(
@@ -1030,16 +1295,10 @@ class _Thumb:
             element.bind(BUTTON_RELEASE, self._release)
 
             # Catch mouse wheel events in thumb elements for usability
-            element.bind(
-                MOUSE_WHEEL,
-                lambda event: self.engine.slide_fast.set(event.delta)
-            )
+            element.bind(MOUSE_WHEEL, self.engine.on_wheel)
 
-        # Trace slider_value to auto update thumb position
-        self.trace_id = self.engine.slider_value.trace_add(
-            "write",
-            self._set
-        )
+        # Observe slider_value to auto update thumb position
+        self.engine.observers.append(self._set)
 
     def _click(self, event):
         """ The thumb is clicked, future mouse events may be dragging
@@ -1054,7 +1313,7 @@ class _Thumb:
         drag the thumb.
         """
         if self._clicked:
-            self.engine.slide.set(event.x_root - self.drag_start_x)
+            self._drag(event.x_root - self.drag_start_x)
             self.drag_start_x = event.x_root
 
     def _move_vert(self, event):
@@ -1062,34 +1321,62 @@ class _Thumb:
         drag the thumb.
         """
         if self._clicked:
-            self.engine.slide.set(self.drag_start_y - event.y_root)
+            self._drag(self.drag_start_y - event.y_root)
             self.drag_start_y = event.y_root
 
+    def _drag(self, delta):
+        """ Collect drag displacement, pass it on to the engine once per
+        idle cycle.
+        """
+        self._drag_delta += delta
+        if self._drag_after is None:
+            self._drag_after = self.parent.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        """ Pass collected drag displacement on to the engine. """
+        self._drag_after = None
+        delta, self._drag_delta = self._drag_delta, 0
+        if delta:
+            self.engine.slide.set(delta)
+
+    def _cancel_drag(self, *_):
+        """ Cancel the scheduled pass on of drag displacement. """
+        if self._drag_after is not None:
+            self.parent.after_cancel(self._drag_after)
+            self._drag_after = None
+
     def _release(self, *_):
         """ Button released, stop dragging and snap if appropriate. """
         self._clicked = False
+        self._cancel_drag()
+        self._flush_drag()
         if self.model.snap_to_ticks:
             self.engine.snap_slider()
 
-    def _set_hor(self, *_):
+    def _set_hor(self, _value, position):
         """ Update position of thumb """
-        # Set internal value of position
-        self.position.set(
-            (self.engine.slider_value.get() - self.model.start_value)
-            / self.model.displacement_to_value
-        )
-        # Graphically move thumb
-        self.parent.coords(self.thumb, self.position.get(), 0)
+        if self._moved(position):
+            # Graphically move thumb, whole pixels only
+            self.parent.coords(self.thumb, self._last_pixel, 0)
 
-    def _set_vert(self, *_):
+    def _set_vert(self, _value, position):
         """ Update position of thumb """
-        # Set internal value of position
-        self.position.set(
-            (self.model.end_value - self.engine.slider_value.get())
-            / self.model.displacement_to_value
-        )
-        # Graphically move thumb
-        self.parent.coords(self.thumb, 0, self.position.get())
+        if self._moved(position):
+            # Graphically move thumb, whole pixels only
+            self.parent.coords(self.thumb, 0, self._last_pixel)
+
+    def _moved(self, position):
+        """ Set internal value of position and notify the observers if
+        the thumb moves to another pixel. Return whether it did.
+        """
+        pixel = int(position)
+        if pixel == self._last_pixel:
+            return False
+        self._last_pixel = pixel
+        self.position = position
+        for observer in self.observers:
+            observer(position)
+        return True
 
     def _classic_thumb(self):
         """ Create classic thumb, consisting of two adjacent
@@ -1298,71 +1585,92 @@ class _Ticks:
         self.bar.pack(side=model.pack_side)
 
         # Catch mouse wheel events in tick bar for usability
-        self.bar.bind(
-            MOUSE_WHEEL,
-            lambda event: engine.slide_fast.set(event.delta)
+        self.bar.bind(MOUSE_WHEEL, engine.on_wheel)
+
+        # Ticks are static, draw them into an image shown as a single
+        # canvas item. Ticks are stored as regions (x1, y1, x2, y2) of
+        # the image.
+        self.image = tk.PhotoImage(
+            master=self.bar,
+            width=model.tick_bar_width,
+            height=model.tick_bar_height,
         )
+        self.bar.create_image(0, 0, anchor=tk.NW, image=self.image)
 
-        # Set orientation-appropriate function for update of self
         if model.orientation == "horizontal":
-            self._draw = self._draw_ticks_hor
+            self.tick_regions = self._tick_regions_hor()
         elif model.orientation == "vertical":
-            self._draw = self._draw_ticks_vert
+            self.tick_regions = self._tick_regions_vert()
 
-        # Redraw self when slider is disabled/enabled
+        # Draw self when first shown, redraw self when slider is
+        # disabled/enabled after that
+        self.mapped = False
+        self.bar.bind(MAP, self._map)
         engine.state.trace_add("write", self._draw)
 
-    def _draw_ticks_hor(self, *_):
-        # Draw ticks for horizontal slider
-        self.bar.delete("tick")
-        y = self.model.tick_bar_height
-        for x in range(
+    def _map(self, *_):
+        """ Draw the ticks once the tick bar is first shown. """
+        self.bar.unbind(MAP)
+        self.mapped = True
+        self._draw()
+
+    def _tick_regions_hor(self):
+        # Ticks for horizontal slider
+        height = self.model.tick_bar_height
+        regions = [
+            (x, 0, x + 1, height)
+            for x in range(
                 self.model.tick_start,
                 self.model.track_width - self.model.tick_start + 1,
                 self.model.tick_width
-        ):
-            self.bar.create_line(x, 0, x,  y,
-                                 fill=self.model.font_color,
-                                 tags="tick"
-                                 )
+            )
+        ]
 
-        # Draw minor ticks
+        # Minor ticks
         if self.model.show_minor_ticks:
-            for x in range(
+            regions += [
+                (x, 0, x + 1, int(height * 0.5))
+                for x in range(
                     self.model.tick_start + int(0.5 * self.model.tick_width),
                     self.model.track_width - self.model.tick_start + 1,
                     self.model.tick_width
-            ):
-                self.bar.create_line(x, 0, x, y * 0.5,
-                                     fill=self.model.font_color,
-                                     tags="tick"
-                                     )
-
-    def _draw_ticks_vert(self, *_):
-        # Draw ticks for a vertical slider
-        self.bar.delete("tick")
-        x = self.model.tick_bar_width
-        for y in range(
+                )
+            ]
+        return regions
+
+    def _tick_regions_vert(self):
+        # Ticks for a vertical slider
+        width = self.model.tick_bar_width
+        regions = [
+            (0, y, width, y + 1)
+            for y in range(
                 self.model.tick_start,
                 self.model.track_height - self.model.tick_start + 1,
                 self.model.tick_width
-        ):
-            self.bar.create_line(0, y, self.model.label_bar_width, y,
-                                 fill=self.model.font_color,
-                                 tags="tick"
-                                 )
+            )
+        ]
 
-        # Draw minor ticks
+        # Minor ticks
         if self.model.show_minor_ticks:
-            for y in range(
+            regions += [
+                (int(width * 0.5), y, width, y + 1)
+                for y in range(
                     self.model.tick_start + int(0.5 * self.model.tick_width),
                     self.model.track_height - self.model.tick_start + 1,
                     self.model.tick_width
-            ):
-                self.bar.create_line(x * 0.5, y, x, y,
-                                     fill=self.model.font_color,
-                                     tags="tick"
-                                     )
+                )
+            ]
+        return regions
+
+    def _draw(self, *_):
+        """ Draw all ticks in the current font color. """
+        if not self.mapped:
+            return
+        self.image.blank()
+        # One row of one pixel, tiled over each region
+        color = "{{" + self.model.font_color + "}}"
+        for region in self.tick_regions:
+            self.image.put(color, to=region)
 
 
 class _BottomLabels:
@@ -1387,67 +1695,79 @@ class _BottomLabels:
         self.bar.pack(side=self.model.pack_side)
 
         # Catch mouse wheel events in label bar for usability
-        self.bar.bind(
-            MOUSE_WHEEL,
-            lambda event: engine.slide_fast.set(event.delta)
-        )
+        self.bar.bind(MOUSE_WHEEL, engine.on_wheel)
 
-        # Set appropriate function to draw label values
-        if self.model.orientation == "horizontal":
-            self.draw_labels = self.draw_labels_hor
-        elif self.model.orientation == "vertical":
-            self.draw_labels = self.draw_labels_vert
-
-        # Redraw self when slider is disabled/enabled
+        # Labels are static, create them once when first shown and
+        # recolor self when slider is disabled/enabled after that
+        self.labels = []
+        self.bar.bind(MAP, self._map)
         engine.state.trace_add("write", self.draw_labels)
 
-    def draw_labels_hor(self, *_):
-        # Create label values for horizontal slider
-        self.bar.delete("bottom_label")
-        label_value = self.model.start_value
-        for x in range(
-                self.model.tick_start + 25,
-                self.model.track_width + 26,
-                self.model.tick_width
-        ):
-            self.bar.create_text(
-                x,
-                self.model.label_bar_height * 0.5 + 2,
-                text=(
-                    f"{self.model.prefix}"
-                    f"{label_value:.{self.model.precision}f}"
-                    f"{self.model.suffix}"
-                ),
-                fill=self.model.font_color,
-                font=self.model.font,
-                tags="bottom_label",
-                anchor=tk.CENTER,
-            )
-            label_value += self.model.tick_width_num
+    def _map(self, *_):
+        """ Compute the position and text of the labels and create
+        them once the label bar is first shown.
+        """
+        self.bar.unbind(MAP)
+        if self.model.orientation == "horizontal":
+            self.labels = self._labels_hor()
+        elif self.model.orientation == "vertical":
+            self.labels = self._labels_vert()
+        self._create_labels()
+
+    def _labels_hor(self):
+        # Return (x, y, text) per label value for horizontal slider
+        y = self.model.label_bar_height * 0.5 + 2
+        xs = range(
+            self.model.tick_start + 25,
+            self.model.track_width + 26,
+            self.model.tick_width
+        )
+        texts = _label_texts(
+            self.model.value_format,
+            self.model.start_value,
+            self.model.tick_width_num,
+            len(xs),
+        )
+        return [(x, y, text) for x, text in zip(xs, texts)]
+
+    def _labels_vert(self):
+        # Return (x, y, text) per label value for "vertical" slider
+        x = self.model.label_bar_width * 0.5
+        ys = range(
+            self.model.tick_start,
+            self.model.track_height - self.model.tick_start + 1,
+            self.model.tick_width
+        )
+        texts = _label_texts(
+            self.model.value_format,
+            self.model.end_value,
+            -self.model.tick_width_num,
+            len(ys),
+        )
+        return [(x, y, text) for y, text in zip(ys, texts)]
+
+    def _create_labels(self):
+        # Create a text item per label, colored by draw_labels().
+        # All items are created by a single Tcl call.
+        coords = []
+        texts = []
+        for x, y, text in self.labels:
+            coords += (x, y)
+            texts.append(text)
+        self.bar.tk.call(
+            "apply",
+            _CREATE_LABELS,
+            self.bar,
+            tuple(coords),
+            tuple(texts),
+            self.model.font_color,
+            self.model.font,
+            "bottom_label",
+        )
 
-    def draw_labels_vert(self, *_):
-        # Create label values for "vertical" slider
-        self.bar.delete("bottom_label")
-        label_value = self.model.end_value
-        for y in range(
-                self.model.tick_start,
-                self.model.track_height - self.model.tick_start + 1,
-                self.model.tick_width
-        ):
-            self.bar.create_text(
-                self.model.label_bar_width * 0.5,
-                y,
-                text=(
-                    f"{self.model.prefix}"
-                    f"{label_value:.{self.model.precision}f}"
-                    f"{self.model.suffix}"
-                ),
-                fill=self.model.font_color,
-                font=self.model.font,
-                tags="bottom_label",
-                anchor=tk.CENTER,
-            )
-            label_value -= self.model.tick_width_num
+    def draw_labels(self, *_):
+        """ Color the label values to match the slider state. """
+        self.bar.itemconfigure("bottom_label", fill=self.model.font_color)
 
 
 if __name__ == "__main__":